@@ -35,6 +35,13 @@ class DisplayConfig:
     height: int = 320
     fps: int = 30
     fullscreen: bool = True
+    # Minimum seconds between SDL event drains; None = half a frame period,
+    # 0 drains on every call (headless tests)
+    event_interval: Optional[float] = None
+
+    @property
+    def frame_period(self) -> float:
+        return 1.0 / self.fps
 
 
 @dataclass
@@ -3,13 +3,12 @@
 import asyncio
 import signal
 import logging
-
-import pygame
+import time
 
 from devdash.config import load_config
 from devdash.database import Database
 from devdash.ui.renderer import Renderer
-from devdash.ui.touch import TouchHandler, GestureType
+from devdash.ui.touch import TouchHandler, GestureType, configure_event_queue
 from devdash.services.github_service import GitHubService
 from devdash.services.copilot_service import CopilotService
 from devdash.services.voice_service import VoiceService
@@ -37,6 +36,8 @@ async def main():
 
     # UI
     renderer = Renderer(config)
+    # Only gesture input is ever read — keep everything else out of SDL's queue
+    configure_event_queue()
     touch = TouchHandler(config)
 
     screen = ConversationScreen(
@@ -67,18 +68,30 @@ async def main():
 
         # Background GitHub data poll
         asyncio.create_task(_periodic_poll(github_svc, config, shutdown_event))
+        # CPU temperature for the status bar, sampled outside the render loop
+        asyncio.create_task(screen.watch_cpu_temp(shutdown_event))
 
         log.info("DevDash started — %dx%d", config.display.width, config.display.height)
 
-        clock = pygame.time.Clock()
+        # Pace frames with asyncio so pollers and voice/AI tasks get the
+        # idle part of each frame instead of a blocking clock.tick().
+        frame_budget = config.display.frame_period
+        last_full = 0.0
         while not shutdown_event.is_set():
+            t0 = time.monotonic()
             for gesture in touch.process_events():
                 if gesture.type == GestureType.TAP:
                     screen.handle_tap(gesture.x, gesture.y)
 
-            screen.render()
-            clock.tick(config.display.fps)
-            await asyncio.sleep(0)
+            # Redraw only when something animates or changed. Once a second
+            # force a full repaint as a safety net for state the frame
+            # signature doesn't cover (e.g. mic availability).
+            if t0 - last_full >= 1.0:
+                screen.render(force=True)
+                last_full = t0
+            elif screen.needs_render:
+                screen.render()
+            await asyncio.sleep(max(0.0, frame_budget - (time.monotonic() - t0)))
 
     except KeyboardInterrupt:
         pass
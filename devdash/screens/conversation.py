@@ -6,6 +6,7 @@ import asyncio
 import logging
 import math
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -25,6 +26,8 @@ CONTENT_PAD = 10
 MSG_GAP     = 8
 BUBBLE_PAD  = 10
 MAX_BUBBLE_W = 430
+MINI_MONA_H  = 36
+BUBBLE_CACHE = 32       # composited message bubbles kept (LRU)
 
 # Idle wander animation timing
 WANDER_PAUSE   = 5.0    # seconds idle at center before wandering
@@ -33,6 +36,11 @@ WANDER_WAIT    = 1.5    # seconds to pause at the side
 WANDER_RETURN  = 3.0    # seconds to walk back to center
 
 
+def splash_mona_h(screen_h: int) -> int:
+    """Height of the splash-screen Mona for a display *screen_h* px tall."""
+    return min(screen_h - STATUS_H - BOTTOM_H - 40, 180)
+
+
 @dataclass
 class Message:
     role: str
@@ -54,9 +62,21 @@ class ConversationScreen:
         self._stream_buf = ""
         self._streaming = False
         self._mic_rect: pygame.Rect | None = None
+        # Finished messages never change: wrap and composite each once
+        self._wrapped: dict[str, list[str]] = {}
+        self._bubbles: OrderedDict[tuple[str, str], pygame.Surface] = OrderedDict()
+        self._mini_rect: pygame.Rect | None = None
+        self._splash_rect: pygame.Rect | None = None
+        self._status_bg: pygame.Surface | None = None
+        self._status_dot: pygame.Surface | None = None
+        self._last_sig: tuple | None = None
         self._happy_until = 0.0
+        self._clock = ""
+        self._clock_epoch = -1
+        self._temp = ""
 
         self.mona = MonaAvatar()
+        self.mona.prewarm(splash_mona_h(self.r.height), MINI_MONA_H)
         self._splash_start = time.time()
         # Wander state: "idle" | "walk_out" | "pause_side" | "walk_back"
         self._wander_state = "idle"
@@ -91,8 +111,15 @@ class ConversationScreen:
                 out.append(cur)
         return out or [""]
 
+    def _msg_lines(self, text: str) -> list[str]:
+        """Wrapped lines of a finished message (cached)."""
+        lines = self._wrapped.get(text)
+        if lines is None:
+            lines = self._wrapped[text] = self._wrap(text)
+        return lines
+
     def _msg_h(self, msg: Message) -> int:
-        return len(self._wrap(msg.text)) * 20 + 2 * BUBBLE_PAD + MSG_GAP
+        return len(self._msg_lines(msg.text)) * 20 + 2 * BUBBLE_PAD + MSG_GAP
 
     def _total_h(self) -> int:
         h = sum(self._msg_h(m) for m in self.messages)
@@ -100,13 +127,24 @@ class ConversationScreen:
             h += len(self._wrap(self._stream_buf)) * 20 + 2 * BUBBLE_PAD + MSG_GAP
         return h
 
-    @staticmethod
-    def _cpu_temp() -> str:
-        try:
-            with open("/sys/class/thermal/thermal_zone0/temp") as f:
-                return f"{int(f.read().strip()) / 1000:.0f}°C"
-        except (FileNotFoundError, ValueError):
-            return ""
+    def _clock_str(self) -> str:
+        """HH:MM for the status bar, re-formatted at most once a second."""
+        now_s = int(time.time())
+        if now_s != self._clock_epoch:
+            self._clock_epoch = now_s
+            self._clock = datetime.now().strftime("%H:%M")
+        return self._clock
+
+    def _cpu_temp(self) -> str:
+        """Latest CPU temperature label; sampled by watch_cpu_temp()."""
+        return self._temp
+
+    async def watch_cpu_temp(self, stop: asyncio.Event, interval: float = 2.0):
+        """Keep the CPU temperature label fresh off the render path."""
+        while not stop.is_set():
+            temp = await self.system.get_cpu_temp()
+            self._temp = f"{temp:.0f}°C" if temp else ""
+            await asyncio.sleep(interval)
 
     # ── Mona state sync ──────────────────────────────────────────────
 
@@ -126,15 +164,53 @@ class ConversationScreen:
 
     # ── render ───────────────────────────────────────────────────────
 
-    def render(self):
+    @property
+    def animating(self) -> bool:
+        """True while something moves on screen between content changes.
+
+        An IDLE mini avatar is a static blit, so chat mode at rest is not.
+        """
+        self._sync_mona()
+        return self._in_splash or self.mona.state != IDLE
+
+    @property
+    def needs_render(self) -> bool:
+        return self.animating or self._frame_sig() != self._last_sig
+
+    def _frame_sig(self) -> tuple:
+        """Everything outside the mini avatar that can change the frame.
+
+        Mona's state is included so leaving an animated state (e.g. the
+        HAPPY glow expiring) still triggers one repaint after animating
+        turns False.
+        """
+        vs = self.voice.state if self.voice.mic_available else VoiceState.IDLE
+        return (len(self.messages), len(self._stream_buf), self._streaming,
+                vs, self.mona.state, self._clock_str(), self._cpu_temp())
+
+    def render(self, force: bool = False):
+        """Draw the frame; *force* repaints everything even if unchanged."""
         self._sync_mona()
+
+        # Between content changes only the avatars (and the splash title)
+        # animate — repaint and present just their rects.
+        sig = self._frame_sig()
+        if not force and sig == self._last_sig and self._mini_rect:
+            if not self._in_splash:
+                self.r.flip([self._redraw_mini()])
+                return
+            if self._splash_rect:
+                self._render_splash_only()
+                return
+        self._last_sig = sig
+
         self.r.clear()
 
         # ── status bar ───────────────────────────────────────────────
         self._draw_status_bar()
 
         if self._in_splash:
-            self._draw_splash()
+            self._splash_rect = self._draw_splash()
         else:
             self._draw_chat()
 
@@ -146,31 +222,55 @@ class ConversationScreen:
     # ── status bar ───────────────────────────────────────────────────
 
     def _draw_status_bar(self):
-        self.r.draw_rect(0, 0, self.r.width, STATUS_H, "surface", border_radius=0)
-        # accent stripe
-        pygame.draw.rect(self.r.screen,
-            self.r.colors.get("accent", (233,69,96)),
-            pygame.Rect(0, STATUS_H - 2, self.r.width, 2))
-
-        ts = datetime.now().strftime("%H:%M")
-        self.r.draw_text(ts, 10, 5, "small", "text_dim")
-        self.r.draw_text("DevDash", self.r.width // 2 - 28, 5, "small", "text")
+        if self._status_bg is None:
+            self._status_bg, self._status_dot = self._build_status_bar()
+        small = self.r.fonts["small"]
+        dim = self.r.text_dim
+        ts = self._clock_str()
+        parts = [(self._status_bg, (0, 0)),
+                 (self.r.render_text(ts, small, dim), (10, 5))]
         temp = self._cpu_temp()
         if temp:
-            self.r.draw_text(temp, self.r.width - 42, 5, "small", "text_dim")
-        # status dot
-        dot_col = self.r.colors.get("success", (0,200,83))
-        pygame.draw.circle(self.r.screen, dot_col, (self.r.width - 12, STATUS_H // 2), 4)
+            parts.append((self.r.render_text(temp, small, dim),
+                          (self.r.width - 42, 5)))
+        # status dot goes last — it overlaps the end of the temperature
+        parts.append((self._status_dot, (self.r.width - 16, STATUS_H // 2 - 4)))
+        self.r.screen.blits(parts, doreturn=False)
+
+    def _build_status_bar(self) -> tuple[pygame.Surface, pygame.Surface]:
+        """Static status-bar background (with title) and status-dot sprite."""
+        bg = pygame.Surface((self.r.width, STATUS_H))
+        bg.fill(self.r.surface_clr)
+        # accent stripe
+        bg.fill(self.r.accent, (0, STATUS_H - 2, self.r.width, 2))
+        font = self.r.fonts["small"]
+        tw = self.r.text_size("DevDash", font)[0]
+        bg.blit(self.r.render_text("DevDash", font, self.r.text),
+                ((self.r.width - tw) // 2, 5))
+        dot = pygame.Surface((9, 9), pygame.SRCALPHA)
+        pygame.draw.circle(dot, self.r.success, (4, 4), 4)
+        return bg, dot
 
     # ── splash (no messages yet) ─────────────────────────────────────
 
-    def _draw_splash(self):
+    def _render_splash_only(self):
+        prev = self._splash_rect
+        self.r.screen.set_clip(prev)
+        self.r.clear()
+        self.r.screen.set_clip(None)
+        self._splash_rect = self._draw_splash()
+        self.r.flip([prev.union(self._splash_rect), self._redraw_mini()])
+
+    def _draw_splash(self) -> pygame.Rect:
+        """Draw Mona + title; returns the area touched (within the content)."""
+        content = pygame.Rect(0, STATUS_H, self.r.width,
+                              self.r.height - STATUS_H - BOTTOM_H)
+        self.r.screen.set_clip(content)
         center_x = self.r.width // 2
         center_y = (STATUS_H + self.r.height - BOTTOM_H) // 2
 
         # Mona + title sizing
-        avail = self.r.height - STATUS_H - BOTTOM_H - 40
-        mona_h = min(avail, 180)
+        mona_h = splash_mona_h(self.r.height)
         title_font = self.r.fonts.get("large", self.r.fonts["heading"])
         title_text = "DevDash"
         title_h = title_font.get_height()
@@ -183,15 +283,17 @@ class ConversationScreen:
         mona_x = center_x
 
         # Draw Mona
-        self.mona.draw(self.r.screen, mona_x, mona_cy, size=mona_h)
+        dirty = self.mona.draw(self.r.screen, mona_x, mona_cy, size=mona_h)
 
         # Title stays centered (doesn't follow Mona)
-        accent = self.r.colors.get("accent", (233, 69, 96))
-        info = self.r.colors.get("info", (41, 121, 255))
+        accent, info = self.r.accent, self.r.info
         letters = title_text
         spacing = 3
-        total_tw = sum(title_font.size(ch)[0] for ch in letters) + spacing * (len(letters) - 1)
+        total_tw = (sum(self.r.text_size(ch, title_font)[0] for ch in letters)
+                    + spacing * (len(letters) - 1))
         lx = center_x - total_tw // 2
+        # ±1 for the offset glow copies
+        dirty.union_ip((lx - 1, ty - 1, total_tw + 2, title_h + 2))
 
         t_val = time.time()
         for idx, ch in enumerate(letters):
@@ -209,7 +311,10 @@ class ConversationScreen:
             letter = title_font.render(ch, True, (r, g, b))
             self.r.screen.blit(letter, (lx, ty))
 
-            lx += title_font.size(ch)[0] + spacing
+            lx += self.r.text_size(ch, title_font)[0] + spacing
+
+        self.r.screen.set_clip(None)
+        return dirty.clip(content)
 
     # ── chat mode ────────────────────────────────────────────────────
 
@@ -226,55 +331,89 @@ class ConversationScreen:
 
         y = top - self.scroll_y
         for msg in self.messages:
-            y = self._draw_msg(msg, y)
+            h = self._msg_h(msg)
+            # Bubbles scrolled out of the clip would draw nothing
+            if top - h < y < bot:
+                self._draw_msg(msg, y)
+            y += h
 
         if self._streaming and self._stream_buf:
-            y = self._draw_msg(Message(role="assistant", text=self._stream_buf), y)
+            # Grows every token — composite it fresh, don't cache it
+            self._draw_msg(Message(role="assistant", text=self._stream_buf), y,
+                           cache=False)
 
         self.r.screen.set_clip(None)
 
-    def _draw_msg(self, msg: Message, y: int) -> int:
-        lines = self._wrap(msg.text)
-        bh = len(lines) * 20 + 2 * BUBBLE_PAD
-
+    def _draw_msg(self, msg: Message, y: int, cache: bool = True) -> None:
         if msg.role == "user":
             bx = self.r.width - MAX_BUBBLE_W - CONTENT_PAD
-            bg = "primary"
             # user indicator dot
             dot_x = self.r.width - CONTENT_PAD + 4
-            pygame.draw.circle(self.r.screen,
-                self.r.colors.get("info", (41,121,255)),
-                (dot_x, y + 14), 4)
+            pygame.draw.circle(self.r.screen, self.r.info, (dot_x, y + 14), 4)
         else:
             bx = CONTENT_PAD
-            bg = "surface"
             # Mona indicator dot
             dot_x = CONTENT_PAD - 8
-            pygame.draw.circle(self.r.screen,
-                self.r.colors.get("accent", (233,69,96)),
-                (dot_x, y + 14), 4)
-
-        self.r.draw_rect(bx, y, MAX_BUBBLE_W, bh, bg, border_radius=10)
-        ty = y + BUBBLE_PAD
+            pygame.draw.circle(self.r.screen, self.r.accent, (dot_x, y + 14), 4)
+
+        self.r.screen.blit(self._bubble(msg, cache), (bx, y))
+
+    def _bubble(self, msg: Message, cache: bool = True) -> pygame.Surface:
+        """Rounded bubble with the message's wrapped text, composited once."""
+        key = (msg.role, msg.text)
+        surf = self._bubbles.get(key)
+        if surf is not None:
+            self._bubbles.move_to_end(key)
+            return surf
+
+        lines = self._msg_lines(msg.text) if cache else self._wrap(msg.text)
+        surf = pygame.Surface((MAX_BUBBLE_W, len(lines) * 20 + 2 * BUBBLE_PAD),
+                              pygame.SRCALPHA)
+        bg = self.r.primary if msg.role == "user" else self.r.surface_clr
+        pygame.draw.rect(surf, bg, surf.get_rect(), border_radius=10)
+        # Loop invariants resolved once per bubble, not per line
+        render = self.r.render_text
+        font, color = self.r.fonts["body"], self.r.text
+        ty = BUBBLE_PAD
         for line in lines:
-            self.r.draw_text(line, bx + BUBBLE_PAD, ty, "body", "text")
+            surf.blit(render(line, font, color), (BUBBLE_PAD, ty))
             ty += 20
-        return y + bh + MSG_GAP
+
+        if cache:
+            self._bubbles[key] = surf
+            if len(self._bubbles) > BUBBLE_CACHE:
+                self._bubbles.popitem(last=False)
+        return surf
 
     # ── bottom bar ───────────────────────────────────────────────────
 
-    def _draw_bottom_bar(self):
+    def _redraw_mini(self) -> pygame.Rect:
+        """Repaint just the mini avatar; returns the area to present."""
+        prev = self._mini_rect
+        self.r.screen.set_clip(prev)
+        self._draw_bottom_bar_bg()
+        self.r.screen.set_clip(None)
+        self._mini_rect = self._draw_mini_mona()
+        return prev.union(self._mini_rect)
+
+    def _draw_bottom_bar_bg(self):
         by = self.r.height - BOTTOM_H
         self.r.draw_rect(0, by, self.r.width, BOTTOM_H, "surface", border_radius=0)
         # top accent line
         pygame.draw.rect(self.r.screen,
-            self.r.colors.get("primary", (15,52,96)),
+            self.r.primary,
             pygame.Rect(0, by, self.r.width, 1))
 
+    def _draw_mini_mona(self) -> pygame.Rect:
         # Mona mini avatar (left side)
         mona_cx = 32
-        mona_cy = by + BOTTOM_H // 2
-        self.mona.draw_mini(self.r.screen, mona_cx, mona_cy, size=36)
+        mona_cy = self.r.height - BOTTOM_H // 2
+        return self.mona.draw_mini(self.r.screen, mona_cx, mona_cy, size=MINI_MONA_H)
+
+    def _draw_bottom_bar(self):
+        by = self.r.height - BOTTOM_H
+        self._draw_bottom_bar_bg()
+        self._mini_rect = self._draw_mini_mona()
 
         # Mic button (right of Mona)
         vs = self.voice.state if self.voice.mic_available else VoiceState.IDLE
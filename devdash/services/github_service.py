@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Callable
 
 from github import Github, GithubException
 
@@ -12,12 +15,54 @@ from devdash.database import Database
 
 log = logging.getLogger(__name__)
 
+# Pause API calls once fewer than this many requests remain in the window
+RATE_LIMIT_FLOOR = 50
+
+
+class GitHubRateLimiter:
+    """Run blocking PyGithub calls off-loop, pausing when quota runs low.
+
+    Covers the background polls and the standup fetch; the Copilot agent
+    calls below still use the shared client directly. PyGithub records the
+    X-RateLimit-Remaining / X-RateLimit-Reset headers of every response;
+    after each call we check them and hold further calls until the window
+    resets once fewer than *floor* requests remain.
+
+    A PyGithub client holds a single connection and is not thread-safe, so
+    every call gets a fresh client from *client* and runs ``fn(gh, ...)``.
+    """
+
+    def __init__(self, client: Callable[[], Github], floor: int = RATE_LIMIT_FLOOR):
+        self._client = client
+        self.floor = floor
+        self._resume_at = 0.0
+
+    async def call(self, fn, *args, **kwargs):
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            log.warning("GitHub rate limit low — pausing %.0fs", delay)
+            await asyncio.sleep(delay)
+
+        gh = self._client()
+
+        def run():
+            result = fn(gh, *args, **kwargs)
+            remaining, _ = gh.rate_limiting
+            return result, remaining, gh.rate_limiting_resettime
+
+        result, remaining, reset_at = await asyncio.to_thread(run)
+        if remaining < self.floor:
+            self._resume_at = max(self._resume_at, float(reset_at))
+        return result
+
 
 class GitHubService:
     def __init__(self, config: AppConfig, db: Database):
         self.config = config
         self.db = db
         self._gh: Github | None = None
+        # Off-loop calls get their own client; self.gh stays on the loop thread
+        self._limiter = GitHubRateLimiter(self._sliced_client)
 
     @property
     def gh(self) -> Github:
@@ -25,6 +70,12 @@ class GitHubService:
             self._gh = Github(self.config.github.token)
         return self._gh
 
+    def _sliced_client(self) -> Github:
+        # Everything run through the limiter slices its listings to at most
+        # 20 items, so one 20-item page each. Full iterations (e.g.
+        # run.jobs()) stay on self.gh with the default page size.
+        return Github(self.config.github.token, per_page=20)
+
     async def poll_all(self):
         """Refresh all data from GitHub API and cache in SQLite."""
         for repo_name in self.config.github.repos:
@@ -37,41 +88,44 @@ class GitHubService:
                 log.error("Poll error for %s: %s", repo_name, e)
 
     async def _poll_prs(self, repo_name: str):
-        repo = self.gh.get_repo(repo_name)
-        prs = repo.get_pulls(state="open", sort="updated", direction="desc")
-        if prs.totalCount == 0:
-            return
-        for pr in prs[:20]:  # Cap at 20
-            await self.db.upsert_pr(
-                repo=repo_name,
-                number=pr.number,
-                title=pr.title,
-                author=pr.user.login,
-                state=pr.state,
-                ci_status=self._get_pr_ci_status(pr),
-            )
+        prs = await self._limiter.call(self._fetch_prs, repo_name)
+        for pr in prs:
+            await self.db.upsert_pr(repo=repo_name, **pr)
 
     async def _poll_ci(self, repo_name: str):
-        repo = self.gh.get_repo(repo_name)
+        runs = await self._limiter.call(self._fetch_failed_runs, repo_name)
+        for run in runs:
+            await self.db.upsert_ci_run(repo=repo_name, **run)
+
+    @classmethod
+    def _fetch_prs(cls, gh: Github, repo_name: str) -> list[dict]:
+        repo = gh.get_repo(repo_name, lazy=True)
+        prs = repo.get_pulls(state="open", sort="updated", direction="desc")
+        # Slices stay within the client's per_page, so each listing is a
+        # single request — no totalCount probe needed for empty repos.
+        return [
+            {"number": pr.number, "title": pr.title, "author": pr.user.login,
+             "state": pr.state, "ci_status": cls._get_pr_ci_status(repo, pr)}
+            for pr in prs[:20]  # Cap at 20
+        ]
+
+    @staticmethod
+    def _fetch_failed_runs(gh: Github, repo_name: str) -> list[dict]:
+        repo = gh.get_repo(repo_name, lazy=True)
         runs = repo.get_workflow_runs(status="completed")
-        if runs.totalCount == 0:
-            return
-        for run in runs[:10]:
-            if run.conclusion == "failure":
-                await self.db.upsert_ci_run(
-                    repo=repo_name,
-                    run_id=run.id,
-                    status=run.status,
-                    conclusion=run.conclusion,
-                    head_sha=run.head_sha,
-                )
-
-    def _get_pr_ci_status(self, pr) -> str:
+        return [
+            {"run_id": run.id, "status": run.status,
+             "conclusion": run.conclusion, "head_sha": run.head_sha}
+            for run in runs[:10]
+            if run.conclusion == "failure"
+        ]
+
+    @staticmethod
+    def _get_pr_ci_status(repo, pr) -> str:
         try:
-            commits = list(pr.get_commits())
-            if not commits:
-                return "unknown"
-            commit = commits[-1]
+            # The head SHA comes with the PR listing — fetch just that commit
+            # rather than paging through all of the PR's commits
+            commit = repo.get_commit(pr.head.sha)
             statuses = commit.get_combined_status()
             return statuses.state  # success, failure, pending
         except Exception:
@@ -129,22 +183,36 @@ class GitHubService:
 
     async def get_recent_activity(self, repo_name: str, hours: int = 16) -> dict:
         """Get recent commits, PRs, and issues for standup generation."""
-        repo = self.gh.get_repo(repo_name)
         since = datetime.now(timezone.utc) - timedelta(hours=hours)
 
-        commits = [
+        # Each limiter call runs on a client of its own, so the two
+        # listings can safely overlap in worker threads
+        async with asyncio.TaskGroup() as tg:
+            commits = tg.create_task(self._limiter.call(
+                self._recent_commits, repo_name, since))
+            merged_prs = tg.create_task(self._limiter.call(
+                self._recent_merged_prs, repo_name, since))
+
+        return {"commits": commits.result(), "merged_prs": merged_prs.result(),
+                "repo": repo_name}
+
+    @staticmethod
+    def _recent_commits(gh: Github, repo_name: str, since: datetime) -> list[dict]:
+        repo = gh.get_repo(repo_name, lazy=True)
+        return [
             {"sha": c.sha[:7], "message": c.commit.message.split("\n")[0], "author": c.author.login if c.author else "unknown"}
             for c in repo.get_commits(since=since)[:20]
         ]
 
-        merged_prs = [
+    @staticmethod
+    def _recent_merged_prs(gh: Github, repo_name: str, since: datetime) -> list[dict]:
+        repo = gh.get_repo(repo_name, lazy=True)
+        return [
             {"number": pr.number, "title": pr.title, "author": pr.user.login}
             for pr in repo.get_pulls(state="closed", sort="updated", direction="desc")[:10]
             if pr.merged and pr.merged_at and pr.merged_at > since
         ]
 
-        return {"commits": commits, "merged_prs": merged_prs, "repo": repo_name}
-
     async def dispatch_workflow(self, repo_name: str, workflow: str, ref: str) -> dict:
         """Trigger a GitHub Actions workflow dispatch."""
         repo = self.gh.get_repo(repo_name)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import platform
 from enum import Enum, auto
 
 log = logging.getLogger(__name__)
@@ -51,10 +53,15 @@ class VoiceService:
             from faster_whisper import WhisperModel
 
             size = self.config.voice.model_size
-            log.info("Loading Whisper model (%s)...", size)
+            compute_type = self._select_compute_type()
+            cpu_threads = max(1, (os.cpu_count() or 2) - 1)
+            log.info("Loading Whisper model (%s, %s, %d threads)...",
+                     size, compute_type, cpu_threads)
             self.model = await asyncio.to_thread(
-                WhisperModel, size, device="cpu", compute_type="int8"
+                WhisperModel, size, device="cpu", compute_type=compute_type,
+                cpu_threads=cpu_threads, num_workers=2,
             )
+            await asyncio.to_thread(self._warm_up)
             log.info("Whisper model loaded")
         except ImportError:
             log.warning("faster-whisper not installed — voice disabled")
@@ -63,6 +70,33 @@ class VoiceService:
             log.error("Whisper model load failed: %s", e)
             self.mic_available = False
 
+    @staticmethod
+    def _select_compute_type() -> str:
+        """Pick the fastest CPU compute type CTranslate2 supports here."""
+        # ARM (Raspberry Pi) has no fast fp16 path — plain int8 is best
+        if platform.machine().lower() not in ("x86_64", "amd64"):
+            return "int8"
+        try:
+            import ctranslate2
+            supported = ctranslate2.get_supported_compute_types("cpu")
+        except Exception:
+            return "int8"
+        return "int8_float16" if "int8_float16" in supported else "int8"
+
+    def _warm_up(self):
+        """Run a throwaway decode so the first real request skips cold start."""
+        try:
+            import ctranslate2
+            import numpy as np
+
+            ctranslate2.set_random_seed(0)
+            silence = np.zeros(self.config.voice.sample_rate // 10, dtype="float32")
+            segments, _ = self.model.transcribe(silence, language="en")
+            for _ in segments:
+                pass
+        except Exception as e:
+            log.debug("Whisper warm-up skipped: %s", e)
+
     async def record_and_transcribe(self, max_seconds: int = 10) -> str:
         """Record audio and transcribe. Runs blocking I/O in threads."""
         if not self.mic_available or not self.model:
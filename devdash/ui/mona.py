@@ -1,6 +1,7 @@
 """Mona — Official GitHub Octocat SVG rendered and animated.
 
-Renders the real Octocat SVG via cairosvg at multiple sizes, then
+Renders the real Octocat SVG via cairosvg at multiple sizes (or loads
+PNGs pre-rendered from it by scripts/rasterize_octocat.py), then
 overlays animated eyes, mouth, and state effects using PyGame.
 """
 
@@ -9,10 +10,13 @@ from __future__ import annotations
 import io
 import math
 import os
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 import pygame
+from pygame import gfxdraw
 
 try:
     import cairosvg
@@ -32,6 +36,8 @@ HAPPY     = "happy"
 
 PUPIL_CLR = (173, 92, 81)     # #AD5C51
 MOUTH_CLR = (173, 92, 81)
+FACE_CLR  = (244, 203, 178)
+EYE_WHITE = (255, 255, 255)
 GLOW_MAP  = {
     LISTENING: (41, 121, 255),
     THINKING:  (255, 214, 0),
@@ -56,10 +62,51 @@ _NOSE_CX, _NOSE_CY, _NOSE_R  = 188.5, 148.56, 4.401
 _MOUTH_CX, _MOUTH_CY         = 188.45, 162.0
 _SVG_CX                       = 189.0
 
+# Arc/angle constants used on the per-frame path
+_SMILE_START  = math.pi + 0.3
+_SMILE_END    = 2 * math.pi - 0.3
+_SPARKLE_STEP = 2 * math.pi / 6
+_SPARKLE_COS  = math.cos(_SPARKLE_STEP)
+_SPARKLE_SIN  = math.sin(_SPARKLE_STEP)
+
 # ── Helpers ──────────────────────────────────────────────────────────
 
-def _i(v):
-    return int(round(v))
+def _i(v: float) -> int:
+    """Round half away from zero (no banker's rounding via round())."""
+    return int(v + 0.5) if v >= 0 else -int(-v + 0.5)
+
+
+def _nbytes(surf: pygame.Surface) -> int:
+    """Pixel memory held by a surface."""
+    return surf.get_pitch() * surf.get_height()
+
+
+def png_path(height: int) -> Path:
+    """Where scripts/rasterize_octocat.py puts the PNG for *height*."""
+    return _SVG_PATH.parent / f"octocat_{height}.png"
+
+
+def svg_to_png(svg_data: bytes, height: int) -> bytes:
+    """Rasterize the Octocat SVG to PNG bytes at *height* (needs cairosvg)."""
+    return cairosvg.svg2png(
+        bytestring=svg_data,
+        output_width=_i(_SVG_W * (height / _SVG_H)),
+        output_height=height,
+    )
+
+
+# 1024-step sine table: animation phases only need ~0.006 rad resolution
+_SIN_TABLE = [math.sin(2 * math.pi * i / 1024) for i in range(1024)]
+_SIN_SCALE = 1024 / (2 * math.pi)
+
+
+def _sin(x: float) -> float:
+    return _SIN_TABLE[int(x * _SIN_SCALE) & 1023]
+
+
+def _cos(x: float) -> float:
+    # cos(x) = sin(x + π/2) — a quarter turn is 256 table steps
+    return _SIN_TABLE[(int(x * _SIN_SCALE) + 256) & 1023]
 
 
 class MonaAvatar:
@@ -67,66 +114,149 @@ class MonaAvatar:
 
     BLINK_EVERY = 3.6
     BLINK_DUR   = 0.13
+    MIN_TICK    = 1 / 240   # draw() + draw_mini() in one frame share a tick
+    GLOW_LEVELS = 16        # pre-rendered pulse steps for both glow halos
+    MINI_BELOW  = 20        # draw() heights below this fall back to draw_mini()
+    # Posed body frames kept across sizes (LRU), bounded by pixel bytes: a
+    # splash-size (180 px) frame is ~176 KB, so this holds ~45 of them —
+    # every pose one state cycles through — where 128 would be ~22 MB.
+    FRAME_CACHE_BYTES = 8 << 20
+
+    # Rendered sizes, posed frames and the SVG source are shared by every
+    # avatar; only the animation clock and effect sprites are per instance.
+    # _CLS_LOCK guards the SVG load and the prewarm thread's PNG hand-off.
+    _CLS_CACHE: dict[int, dict] = {}
+    _CLS_FRAMES: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+    _CLS_FRAME_BYTES: int = 0
+    _CLS_SVG_DATA: bytes | None = None
+    # Heights being rasterized by prewarm(); finished PNGs land in _CLS_PNG
+    _CLS_PENDING: set[int] = set()
+    _CLS_PNG: dict[int, bytes | None] = {}
+    _CLS_LOCK = threading.Lock()
+
+    __slots__ = ("state", "_t", "_st", "_bt", "_prev", "_pulse",
+                 "_glow_cache", "_stamps")
 
     def __init__(self):
         self.state: str = IDLE
-        self._t   = 0.0
-        self._st  = 0.0
-        self._bt  = 0.0
-        self._prev = time.monotonic()
-        self._cache: dict = {}
-        self._svg_data: bytes | None = None
+        self._t: float  = 0.0
+        self._st: float = 0.0
+        self._bt: float = 0.0
+        self._prev: float = time.monotonic()
+        self._pulse: float = 0.5
+        self._glow_cache: dict[tuple, pygame.Surface] = {}
+        # Effect sprites keyed by (state, size, alpha >> 4[, width])
+        self._stamps: dict[tuple, pygame.Surface] = {}
         self._load_svg()
 
-    def _load_svg(self):
-        """Read SVG file once."""
-        try:
-            self._svg_data = _SVG_PATH.read_bytes()
-        except FileNotFoundError:
-            self._svg_data = None
+    @classmethod
+    def _load_svg(cls):
+        """Read SVG file once for all avatars (b"" if it is missing)."""
+        with cls._CLS_LOCK:
+            if cls._CLS_SVG_DATA is None:
+                try:
+                    cls._CLS_SVG_DATA = _SVG_PATH.read_bytes()
+                except FileNotFoundError:
+                    cls._CLS_SVG_DATA = b""
+
+    def prewarm(self, *heights: int) -> None:
+        """Rasterize the SVG for *heights* on a background thread.
+
+        cairosvg takes tens of ms per size on a Pi; until a height is ready
+        draw()/draw_mini() show the plain placeholder instead of stalling.
+        """
+        todo = [h for h in heights
+                if h not in self._CLS_CACHE and h not in self._CLS_PENDING]
+        if todo:
+            self._CLS_PENDING.update(todo)
+            threading.Thread(target=self._prewarm_worker, args=(todo,),
+                             daemon=True).start()
+
+    def _prewarm_worker(self, heights: list[int]) -> None:
+        for h in heights:
+            png = self._rasterize(h)
+            with self._CLS_LOCK:
+                self._CLS_PNG[h] = png
 
     def set_state(self, state: str):
         if state != self.state:
             self.state = state
             self._st = 0.0
+            self._pulse = 0.5
 
-    def _tick(self):
+    def _tick(self) -> None:
         now = time.monotonic()
         dt = now - self._prev
+        if dt < self.MIN_TICK:
+            return
         self._prev = now
         self._t  += dt
         self._st += dt
         self._bt += dt
+        if self._bt >= self.BLINK_EVERY:
+            # Wrap the blink timer so it stays bounded over long sessions
+            self._bt %= self.BLINK_EVERY
+        self._pulse = 0.5 + 0.5 * _sin(self._st * 3)
 
     # ── SVG rendering & caching ──────────────────────────────────────
 
     def _get(self, height: int) -> dict:
         """Get cached rendered SVG surface + metrics for a target height."""
-        if height not in self._cache:
-            self._cache[height] = self._render_svg(height)
-        return self._cache[height]
+        cache = self._CLS_CACHE
+        c = cache.get(height)
+        if height in self._CLS_PENDING:
+            with self._CLS_LOCK:
+                ready = height in self._CLS_PNG
+                png = self._CLS_PNG.pop(height, None)
+            if ready:
+                # Swap the placeholder for the real SVG and drop the posed
+                # frames built from it
+                self._CLS_PENDING.discard(height)
+                frames = self._CLS_FRAMES
+                for pose in [k for k in frames if k[0] == height]:
+                    MonaAvatar._CLS_FRAME_BYTES -= _nbytes(frames.pop(pose))
+                c = cache[height] = self._render_svg(height, png)
+            elif c is None:
+                c = cache[height] = self._render_svg(height, None)
+        elif c is None:
+            c = cache[height] = self._render_svg(
+                height, self._rasterize(height))
+        return c
 
     def _get_flipped(self, height: int) -> pygame.Surface:
         """Get horizontally flipped SVG surface (cached)."""
-        key = f"flip_{height}"
-        if key not in self._cache:
-            c = self._get(height)
-            self._cache[key] = pygame.transform.flip(c["surf"], True, False)
-        return self._cache[key]
-
-    def _render_svg(self, target_h: int) -> dict:
-        """Render the SVG to a pygame Surface at the given height."""
+        c = self._get(height)
+        flip = c["flip"]
+        if flip is None:
+            flip = c["flip"] = pygame.transform.flip(c["surf"], True, False)
+        return flip
+
+    def _rasterize(self, target_h: int) -> bytes | None:
+        """PNG bytes at the given height (safe off the main thread).
+
+        Prefers the PNG pre-rendered by scripts/rasterize_octocat.py and
+        only falls back to cairosvg when there isn't one for this height.
+        """
+        try:
+            return png_path(target_h).read_bytes()
+        except OSError:
+            pass
+        svg_data = self._CLS_SVG_DATA
+        if not (_HAS_CAIRO and svg_data):
+            return None
+        try:
+            return svg_to_png(svg_data, target_h)
+        except Exception:
+            return None
+
+    def _render_svg(self, target_h: int, png_data: bytes | None) -> dict:
+        """Build the cache entry for a height from rasterized PNG bytes."""
         scale = target_h / _SVG_H
         target_w = _i(_SVG_W * scale)
 
         surf = None
-        if _HAS_CAIRO and self._svg_data:
+        if png_data:
             try:
-                png_data = cairosvg.svg2png(
-                    bytestring=self._svg_data,
-                    output_width=target_w,
-                    output_height=target_h,
-                )
                 surf = pygame.image.load(io.BytesIO(png_data)).convert_alpha()
             except Exception:
                 surf = None
@@ -138,232 +268,377 @@ class MonaAvatar:
                                (target_w // 2, target_h // 2),
                                min(target_w, target_h) // 3)
 
-        return {
+        c = {
             "surf": surf,
             "w": target_w,
             "h": target_h,
             "scale": scale,
         }
+        c.update(self._metrics(scale, target_h))
+        c["base"] = self._bake_base(c)
+        c["flip"] = None  # built on first sideways draw
+        return c
 
-    # ── SVG-to-screen coordinate mapping ─────────────────────────────
+    @staticmethod
+    def _bake_base(c: dict) -> pygame.Surface:
+        """SVG with the static pupils painted out — forward-facing frames
+        blit this and only draw the moving pupils on top."""
+        base = c["surf"].copy()
+        erx, ery = c["erx"], c["ery"]
+        ox, oy = c["w"] // 2, c["h"] // 2
+        for dx, dy in c["eyes"]:
+            pygame.draw.ellipse(base, EYE_WHITE,
+                                (ox + dx - erx, oy + dy - ery, erx * 2, ery * 2))
+        return base
+
+    # ── Size-scaled geometry (computed once per height) ──────────────
 
     @staticmethod
-    def _map(svg_x, svg_y, cx, cy, c):
-        """Map SVG coordinates to screen coords given blit center."""
-        s = c["scale"]
-        # SVG origin is at viewBox corner; center offset
-        sx = (svg_x - _SVG_CX) * s + cx
-        sy = (svg_y + 1) * s + (cy - c["h"] // 2)  # +1 for viewBox y=-1
-        return _i(sx), _i(sy)
+    def _offset(svg_x: float, svg_y: float, s: float, h: int) -> tuple[int, int]:
+        """Offset of an SVG point from the blit center, in screen pixels."""
+        # SVG origin is at viewBox corner; +1 for viewBox y=-1
+        return _i((svg_x - _SVG_CX) * s), _i((svg_y + 1) * s) - h // 2
+
+    def _metrics(self, s: float, h: int) -> dict:
+        """Integer geometry for every overlay primitive at scale *s*."""
+        return {
+            "eyes": (self._offset(_LEFT_EYE_CX, _LEFT_EYE_CY, s, h),
+                     self._offset(_RIGHT_EYE_CX, _RIGHT_EYE_CY, s, h)),
+            "mouth": self._offset(_MOUTH_CX, _MOUTH_CY, s, h),
+            "erx": _i(_EYE_RX * s), "ery": _i(_EYE_RY * s),
+            "prx": _i(_PUPIL_RX * s), "pry": _i(_PUPIL_RY * s),
+            "blink_w": max(2, _i(2 * s)),
+            "hl1_r": max(1, _i(3.5 * s)), "hl1_dx": _i(4 * s), "hl1_dy": _i(5 * s),
+            "hl2_r": max(1, _i(1.5 * s)), "hl2_dx": _i(2 * s), "hl2_dy": _i(3 * s),
+            "r4": _i(4 * s), "r5": _i(5 * s),
+            "r8": _i(8 * s), "r10": _i(10 * s), "r12": _i(12 * s),
+            "r24": _i(24 * s), "r40": _i(40 * s), "r50": _i(50 * s),
+            "r55": _i(55 * s), "r60": _i(60 * s), "r20": _i(20 * s),
+            "arc_w": max(2, _i(2.5 * s)), "line_w": max(1, _i(s)),
+            "mini_gr": _i(h * 0.6), "mini_dy": _i(h * 0.35),
+            "fx": self._fx_bounds(s),
+        }
+
+    @staticmethod
+    def _fx_bounds(s: float) -> dict:
+        """Per-state extent of _effects, as (dx, dy, w, h) from the center."""
+        dot = max(1, _i(8 * s)) + 1
+        x0, y0 = _i(55 * s) - dot, -_i(40 * s) - 2 * _i(8 * s) - dot
+        x1, y1 = _i(55 * s) + 2 * _i(12 * s) + dot, -_i(40 * s) + dot
+        arc = _i(50.8 * s) + 1
+        ring = _i(60 * s) + _i(4 * s) + max(1, _i(s)) + 1
+        return {
+            THINKING: (x0, y0, x1 - x0, y1 - y0),
+            LISTENING: (_i(50 * s) - arc, -_i(20 * s) - arc, arc * 2, arc * 2),
+            HAPPY: (-ring, -ring, ring * 2, ring * 2),
+        }
 
     # ── Draw full ────────────────────────────────────────────────────
 
     def draw(self, surf: pygame.Surface, cx: int, cy: int, size: int = 72,
-             facing: int = 0):
+             facing: int = 0) -> pygame.Rect:
         """Draw Mona centered at (cx, cy). *size* = desired height in px.
 
         *facing*: 0 = forward, 1 = facing right, -1 = facing left.
+        Returns the screen area touched, for ``pygame.display.update``.
         """
+        if size < self.MINI_BELOW:
+            # Overlays and effects are sub-pixel noise at this height
+            return self.draw_mini(surf, cx, cy, size)
         self._tick()
         c = self._get(size)
-        s = c["scale"]
-
-        # Glow aura behind SVG
-        self._glow(surf, cx, cy, size, s)
 
         # Blit the full SVG (or flipped version for sideways facing)
         bx = cx - c["w"] // 2
         by = cy - c["h"] // 2
-        if facing == -1:
+        dirty = pygame.Rect(bx, by, c["w"], c["h"])
+
+        # Glow aura behind SVG
+        glow = self._glow(surf, cx, cy, size, c)
+        if glow:
+            dirty.union_ip(glow)
+
+        if facing == 0:
+            # Forward-facing frames carry the animated eyes and mouth
+            surf.blit(self._posed(size, c), (bx, by))
+        elif facing == -1:
             surf.blit(self._get_flipped(size), (bx, by))
         else:
             surf.blit(c["surf"], (bx, by))
 
-        # Overlay animated eyes only when facing forward
-        if facing == 0:
-            self._animated_eyes(surf, cx, cy, c)
+        # State effects, skipped when they'd land entirely outside the clip
+        fx = c["fx"].get(self.state)
+        if fx:
+            area = pygame.Rect(cx + fx[0], cy + fx[1], fx[2], fx[3])
+            if area.colliderect(surf.get_clip()):
+                self._effects(surf, cx, cy, c)
+                dirty.union_ip(area)
+        return dirty
+
+    # ── Posed body frames ────────────────────────────────────────────
+
+    def _posed(self, size: int, c: dict) -> pygame.Surface:
+        """Forward-facing SVG with this frame's eyes and mouth.
+
+        Time only reaches these pixels through the rounded pupil offset,
+        the blink flag and the mouth shape, so composed frames are cached
+        by that integer pose (LRU, up to FRAME_CACHE_BYTES of pixels).
+        """
+        s = c["scale"]
+        px, py = self._gaze()
+        mouth = 0
+        if self.state == SPEAKING:
+            o = 0.3 + 0.7 * abs(_sin(self._st * 5))
+            mouth = max(2, int(6 * s * o + 0.5))
+        elif self.state == HAPPY:
+            mouth = -1
+        pose = (size, _i(px * s), _i(py * s), self._blinking(), mouth)
+
+        frames = self._CLS_FRAMES
+        frame = frames.get(pose)
+        if frame is None:
+            frame = frames[pose] = self._compose(c, *pose[1:])
+            used = MonaAvatar._CLS_FRAME_BYTES + _nbytes(frame)
+            while used > self.FRAME_CACHE_BYTES and len(frames) > 1:
+                used -= _nbytes(frames.popitem(last=False)[1])
+            MonaAvatar._CLS_FRAME_BYTES = used
+        else:
+            frames.move_to_end(pose)
+        return frame
 
-            # Overlay animated mouth when speaking
-            if self.state in (SPEAKING, HAPPY):
-                self._animated_mouth(surf, cx, cy, c)
+    def _compose(self, c: dict, dx: int, dy: int, blink: bool,
+                 mouth: int) -> pygame.Surface:
+        """Base plus eyes and mouth for one pose, as a single surface.
 
-        # State effects
-        self._effects(surf, cx, cy, s)
+        gfxdraw writes anti-aliasing coverage into the alpha channel of
+        SRCALPHA targets instead of blending, so each eye is drawn on an
+        opaque patch cut from the face and copied back.
+        """
+        frame = c["base"].copy()
+        cx, cy = c["w"] // 2, c["h"] // 2
+        # Pad so an offset pupil's AA rim never touches the patch edge
+        erx, ery = c["erx"] + 2, c["ery"] + 2
+        patch = pygame.Surface((erx * 2, ery * 2))
+        for ex, ey in c["eyes"]:
+            x, y = cx + ex - erx, cy + ey - ery
+            patch.blit(frame, (0, 0), (x, y, erx * 2, ery * 2))
+            self._eye(patch, erx, ery, dx, dy, blink, c)
+            frame.blit(patch, (x, y))
+        if mouth:
+            self._animated_mouth(frame, cx, cy, c, mouth)
+        return frame
 
     # ── Draw mini ────────────────────────────────────────────────────
 
-    def draw_mini(self, surf: pygame.Surface, cx: int, cy: int, size: int = 28):
-        """Tiny Mona for the bottom bar — just the SVG scaled down."""
+    def draw_mini(self, surf: pygame.Surface, cx: int, cy: int,
+                  size: int = 28) -> pygame.Rect:
+        """Tiny Mona for the bottom bar — just the SVG scaled down.
+
+        Returns the screen area touched, like :meth:`draw`.
+        """
         self._tick()
-        # For mini, crop to roughly the head area (upper 55% of SVG)
-        head_h = _i(size * 0.55)
         c = self._get(size)
-        s = c["scale"]
+        # Offset up to show head centered
+        bx = cx - c["w"] // 2
+        by = cy - c["mini_dy"]
+        dirty = pygame.Rect(bx, by, c["w"], c["h"])
 
         # Mini glow
         gc = GLOW_MAP.get(self.state)
         if gc:
-            pulse = 0.5 + 0.5 * math.sin(self._st * 3)
-            gr = _i(size * 0.6)
-            gs = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
-            pygame.draw.circle(gs, (*gc, _i(22 * pulse)), (gr, gr), gr)
-            surf.blit(gs, (cx - gr, cy - gr))
+            gr = c["mini_gr"]
+            level = self._glow_level()
+            key = ("mini", gc, gr, level)
+            halo = self._glow_cache.get(key)
+            if halo is None:
+                a = int(22 * level / (self.GLOW_LEVELS - 1) + 0.5)
+                halo = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
+                pygame.draw.circle(halo, (*gc, a), (gr, gr), gr)
+                self._glow_cache[key] = halo
+            dirty.union_ip(surf.blit(halo, (cx - gr, cy - gr)))
 
-        # Blit SVG (offset up to show head centered)
-        bx = cx - c["w"] // 2
-        by = cy - _i(c["h"] * 0.35)
         surf.blit(c["surf"], (bx, by))
+        return dirty
 
-    # ── Animated eyes ────────────────────────────────────────────────
+    def _glow_level(self) -> int:
+        """Current pulse quantized to one of GLOW_LEVELS halo steps."""
+        return int(self._pulse * (self.GLOW_LEVELS - 1) + 0.5)
 
-    def _animated_eyes(self, surf, cx, cy, c):
-        """Overlay animated pupils on the SVG eyes."""
-        s = c["scale"]
+    def _blinking(self) -> bool:
+        return (self._bt > self.BLINK_EVERY - self.BLINK_DUR
+                and self.state == IDLE)
 
-        # Blink check
-        blink = ((self._bt % self.BLINK_EVERY)
-                 > (self.BLINK_EVERY - self.BLINK_DUR)
-                 and self.state == IDLE)
+    # ── Animated eyes ────────────────────────────────────────────────
 
-        # Pupil offset for gaze
-        px, py = 0.0, 0.0
+    def _gaze(self) -> tuple[float, float]:
+        """Pupil offset for the current state, in SVG units."""
         if self.state == THINKING:
-            px = 4.0 * math.sin(self._st * 1.5)
-            py = -3.0 * math.cos(self._st * 1.5)
-        elif self.state == SPEAKING:
-            py = 1.5
-        elif self.state == LISTENING:
+            return 4.0 * _sin(self._st * 1.5), -3.0 * _cos(self._st * 1.5)
+        if self.state == SPEAKING:
+            return 0.0, 1.5
+        if self.state == LISTENING:
             # Look slightly toward the user
-            px = -1.0
-            py = 1.0
-
-        for eye_cx, eye_cy in [(_LEFT_EYE_CX, _LEFT_EYE_CY),
-                                (_RIGHT_EYE_CX, _RIGHT_EYE_CY)]:
-            # Screen position of eye center
-            ex, ey = self._map(eye_cx, eye_cy, cx, cy, c)
-            erx = _i(_EYE_RX * s)
-            ery = _i(_EYE_RY * s)
-            prx = _i(_PUPIL_RX * s)
-            pry = _i(_PUPIL_RY * s)
-            ppx = _i(px * s)
-            ppy = _i(py * s)
-
-            if blink:
-                # Cover eye white with face color, draw closed line
-                pygame.draw.ellipse(surf, (244, 203, 178),
-                                    (ex - erx, ey - ery, erx * 2, ery * 2))
-                pygame.draw.line(surf, PUPIL_CLR,
-                                 (ex - erx + 2, ey), (ex + erx - 2, ey),
-                                 max(2, _i(2 * s)))
-            else:
-                # Redraw eye white (covers original static pupils)
-                pygame.draw.ellipse(surf, (255, 255, 255),
-                                    (ex - erx, ey - ery, erx * 2, ery * 2))
-
-                # Pupil at offset position
-                pygame.draw.ellipse(surf, PUPIL_CLR,
-                                    (ex + ppx - prx, ey + ppy - pry,
-                                     prx * 2, pry * 2))
-
-                # Highlight
-                sh = max(1, _i(3.5 * s))
-                pygame.draw.circle(surf, (255, 255, 255),
-                                   (ex + ppx - _i(4 * s),
-                                    ey + ppy - _i(5 * s)), sh)
-                sh2 = max(1, _i(1.5 * s))
-                pygame.draw.circle(surf, (255, 255, 255),
-                                   (ex + ppx + _i(2 * s),
-                                    ey + ppy + _i(3 * s)), sh2)
+            return -1.0, 1.0
+        return 0.0, 0.0
+
+    @staticmethod
+    def _eye(surf: pygame.Surface, ex: int, ey: int, dx: int, dy: int,
+             blink: bool, c: dict) -> None:
+        """Draw one eye centred at (ex, ey) with the pupil offset (dx, dy)."""
+        erx, ery = c["erx"], c["ery"]
+        if blink:
+            # Cover eye white with face color, draw closed line
+            pygame.draw.ellipse(surf, FACE_CLR,
+                                (ex - erx, ey - ery, erx * 2, ery * 2))
+            pygame.draw.line(surf, PUPIL_CLR,
+                             (ex - erx + 2, ey), (ex + erx - 2, ey),
+                             c["blink_w"])
+            return
+
+        # Pupil at offset position
+        prx, pry = c["prx"], c["pry"]
+        pcx, pcy = ex + dx, ey + dy
+        gfxdraw.filled_ellipse(surf, pcx, pcy, prx, pry, PUPIL_CLR)
+        gfxdraw.aaellipse(surf, pcx, pcy, prx, pry, PUPIL_CLR)
+
+        # Highlights — gfxdraw spans 2r+1 px where draw.circle spans 2r
+        hx, hy, hr = pcx - c["hl1_dx"], pcy - c["hl1_dy"], c["hl1_r"] - 1
+        gfxdraw.filled_circle(surf, hx, hy, hr, EYE_WHITE)
+        gfxdraw.aacircle(surf, hx, hy, hr, EYE_WHITE)
+        hx, hy, hr = pcx + c["hl2_dx"], pcy + c["hl2_dy"], c["hl2_r"] - 1
+        gfxdraw.filled_circle(surf, hx, hy, hr, EYE_WHITE)
+        gfxdraw.aacircle(surf, hx, hy, hr, EYE_WHITE)
 
     # ── Animated mouth ───────────────────────────────────────────────
 
-    def _animated_mouth(self, surf, cx, cy, c):
-        s = c["scale"]
-        mx, my = self._map(_MOUTH_CX, _MOUTH_CY, cx, cy, c)
+    @staticmethod
+    def _animated_mouth(surf: pygame.Surface, cx: int, cy: int,
+                        c: dict, h: int) -> None:
+        """Open mouth *h* px tall when h > 0, the HAPPY smile when h < 0."""
+        mx, my = cx + c["mouth"][0], cy + c["mouth"][1]
 
-        if self.state == SPEAKING:
-            o = 0.3 + 0.7 * abs(math.sin(self._st * 5))
-            h = max(2, _i(6 * s * o))
-            w = _i(5 * s)
+        if h > 0:
+            w = c["r5"]
             # Cover original mouth
-            pygame.draw.ellipse(surf, (244, 203, 178),
-                                (mx - _i(12 * s), my - _i(4 * s),
-                                 _i(24 * s), _i(8 * s)))
+            pygame.draw.ellipse(surf, FACE_CLR,
+                                (mx - c["r12"], my - c["r4"],
+                                 c["r24"], c["r8"]))
             # Open mouth
             pygame.draw.ellipse(surf, MOUTH_CLR,
                                 (mx - w, my - h // 2, w * 2, h))
-        elif self.state == HAPPY:
-            w = _i(10 * s)
-            rect = pygame.Rect(mx - w, my - _i(4 * s), w * 2, _i(10 * s))
+        else:
+            w = c["r10"]
             # Cover original
-            pygame.draw.ellipse(surf, (244, 203, 178),
-                                (mx - _i(12 * s), my - _i(4 * s),
-                                 _i(24 * s), _i(10 * s)))
+            pygame.draw.ellipse(surf, FACE_CLR,
+                                (mx - c["r12"], my - c["r4"],
+                                 c["r24"], c["r10"]))
             # Big smile
-            pygame.draw.arc(surf, MOUTH_CLR, rect,
-                            math.pi + 0.3, 2 * math.pi - 0.3,
-                            max(2, _i(2.5 * s)))
+            pygame.draw.arc(surf, MOUTH_CLR,
+                            (mx - w, my - c["r4"], w * 2, w),
+                            _SMILE_START, _SMILE_END, c["arc_w"])
 
     # ── Glow aura ────────────────────────────────────────────────────
 
-    def _glow(self, surf, cx, cy, size, s):
+    def _glow(self, surf: pygame.Surface, cx: int, cy: int, size: int,
+              c: dict) -> pygame.Rect | None:
         gc = GLOW_MAP.get(self.state)
         if gc is None:
-            return
-        pulse = 0.5 + 0.5 * math.sin(self._st * 3)
-        r = _i(size * 0.45 + 10 * pulse * s)
-        gs = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-        a = _i(25 + 25 * pulse)
-        pygame.draw.circle(gs, (*gc, a), (r, r), r)
-        surf.blit(gs, (cx - r, cy - r))
+            return None
+        level = self._glow_level()
+        key = (gc, size, level)
+        halo = self._glow_cache.get(key)
+        if halo is None:
+            pulse = level / (self.GLOW_LEVELS - 1)
+            r = int(size * 0.45 + 10 * pulse * c["scale"] + 0.5)
+            a = int(25 + 25 * pulse + 0.5)
+            halo = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+            pygame.draw.circle(halo, (*gc, a), (r, r), r)
+            self._glow_cache[key] = halo
+        r = halo.get_width() // 2
+        area = pygame.Rect(cx - r, cy - r, r * 2, r * 2)
+        if not area.colliderect(surf.get_clip()):
+            return None
+        return surf.blit(halo, area)
 
     # ── State effects ────────────────────────────────────────────────
 
-    def _effects(self, surf, cx, cy, s):
+    def _effects(self, surf: pygame.Surface, cx: int, cy: int,
+                 c: dict) -> None:
+        # Runs every animated frame: loop invariants are bound to locals
+        s = c["scale"]
+        st = self._st
+        stamps = self._stamps
         if self.state == THINKING:
+            # Stamp blits are collected and issued in one blits() call
+            batch = []
+            add = batch.append
+            col = GLOW_MAP[THINKING]
+            r8, r12 = c["r8"], c["r12"]
+            x0, y0 = cx + c["r55"], cy - c["r40"]
             for i in range(3):
-                phase = (self._st - i * 0.4) % 1.6
+                phase = (st - i * 0.4) % 1.6
                 if phase < 1.0:
                     frac = min(1.0, min(1.0, phase / 0.2)
                               * max(0.0, 1 - (phase - 0.4) / 0.6))
-                    r = max(1, _i((4 + i * 2) * s * frac))
-                    dx = cx + _i(55 * s) + i * _i(12 * s)
-                    dy = cy - _i(40 * s) - i * _i(8 * s)
-                    a = max(0, min(255, _i(200 * frac)))
-                    ds = pygame.Surface((r * 2 + 2, r * 2 + 2),
-                                        pygame.SRCALPHA)
-                    pygame.draw.circle(ds, (*GLOW_MAP[THINKING], a),
-                                       (r + 1, r + 1), r)
-                    surf.blit(ds, (dx - r - 1, dy - r - 1))
+                    r = max(1, int((4 + i * 2) * s * frac + 0.5))
+                    dx = x0 + i * r12
+                    dy = y0 - i * r8
+                    a = max(0, min(255, int(200 * frac + 0.5)))
+                    key = (THINKING, r, a >> 4)
+                    dot = stamps.get(key)
+                    if dot is None:
+                        d = r * 2 + 2
+                        dot = pygame.Surface((d, d), pygame.SRCALPHA)
+                        pygame.draw.circle(dot, (*col, (a >> 4) << 4 | 8),
+                                           (r + 1, r + 1), r)
+                        stamps[key] = dot
+                    add((dot, (dx - r - 1, dy - r - 1)))
+            surf.blits(batch, doreturn=False)
 
         elif self.state == LISTENING:
+            batch = []
+            add = batch.append
+            col = GLOW_MAP[LISTENING]
+            arc_w = c["arc_w"]
+            x0, y0 = cx + c["r50"], cy - c["r20"]
             for i in range(3):
-                phase = (self._st * 2 + i * 0.5) % 2.0
+                phase = (st * 2 + i * 0.5) % 2.0
                 if phase < 1.4:
-                    arc_r = _i((20 + 22 * phase) * s)
-                    a = max(0, min(255, _i(140 * (1 - phase / 1.4))))
-                    arc_s = pygame.Surface((arc_r * 2, arc_r * 2),
-                                           pygame.SRCALPHA)
-                    pygame.draw.arc(arc_s, (*GLOW_MAP[LISTENING], a),
-                                    (0, 0, arc_r * 2, arc_r * 2),
-                                    -0.5, 0.5, max(2, _i(2.5 * s)))
-                    surf.blit(arc_s,
-                              (cx + _i(50 * s) - arc_r, cy - _i(20 * s) - arc_r))
+                    arc_r = int((20 + 22 * phase) * s + 0.5)
+                    a = max(0, min(255, int(140 * (1 - phase / 1.4) + 0.5)))
+                    key = (LISTENING, arc_r, a >> 4, arc_w)
+                    arc = stamps.get(key)
+                    if arc is None:
+                        d = arc_r * 2
+                        arc = pygame.Surface((d, d), pygame.SRCALPHA)
+                        pygame.draw.arc(arc, (*col, (a >> 4) << 4 | 8),
+                                        (0, 0, d, d), -0.5, 0.5, arc_w)
+                        stamps[key] = arc
+                    add((arc, (x0 - arc_r, y0 - arc_r)))
+            surf.blits(batch, doreturn=False)
 
         elif self.state == HAPPY:
-            for i in range(6):
-                angle = self._st * 1.5 + i * (2 * math.pi / 6)
-                dist = _i(60 * s)
-                sx = cx + _i(dist * math.cos(angle))
-                sy = cy + _i(dist * math.sin(angle))
-                sz = max(1, _i(4 * s
-                               * abs(math.sin(self._st * 3.5 + i * 1.2))))
-                c = GLOW_MAP[HAPPY]
-                w = max(1, _i(s))
-                pygame.draw.line(surf, c, (sx - sz, sy), (sx + sz, sy), w)
-                pygame.draw.line(surf, c, (sx, sy - sz), (sx, sy + sz), w)
-                dsz = _i(sz * 0.6)
-                pygame.draw.line(surf, c,
-                                 (sx - dsz, sy - dsz), (sx + dsz, sy + dsz), 1)
-                pygame.draw.line(surf, c,
-                                 (sx - dsz, sy + dsz), (sx + dsz, sy - dsz), 1)
+            dist = c["r60"]
+            w = c["line_w"]
+            col = GLOW_MAP[HAPPY]
+            line = pygame.draw.line
+            sin = _sin
+            kc, ks = _SPARKLE_COS, _SPARKLE_SIN
+            # Seed the ring direction once, then rotate by a fixed step
+            angle = st * 1.5
+            ux, uy = _cos(angle), sin(angle)
+            # Sparkles are pure line draws — share a single surface lock
+            surf.lock()
+            try:
+                for i in range(6):
+                    sx = int(cx + dist * ux + 0.5)
+                    sy = int(cy + dist * uy + 0.5)
+                    ux, uy = ux * kc - uy * ks, ux * ks + uy * kc
+                    sz = max(1, int(4 * s * abs(sin(st * 3.5 + i * 1.2)) + 0.5))
+                    line(surf, col, (sx - sz, sy), (sx + sz, sy), w)
+                    line(surf, col, (sx, sy - sz), (sx, sy + sz), w)
+                    dsz = int(sz * 0.6 + 0.5)
+                    line(surf, col, (sx - dsz, sy - dsz), (sx + dsz, sy + dsz), 1)
+                    line(surf, col, (sx - dsz, sy + dsz), (sx + dsz, sy - dsz), 1)
+            finally:
+                surf.unlock()
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 import pygame
@@ -12,6 +14,30 @@ from devdash.config import AppConfig
 log = logging.getLogger(__name__)
 
 FONT_DIR = Path(__file__).parent.parent / "assets" / "fonts"
+TEXT_CACHE = 512  # rendered text surfaces kept (LRU)
+
+
+@lru_cache(maxsize=512)
+def _measure(font: pygame.font.Font, text: str) -> tuple[int, int]:
+    """``font.size(text)``, memoized — labels are re-measured every frame."""
+    return font.size(text)
+
+
+@lru_cache(maxsize=256)
+def _truncate(font: pygame.font.Font, text: str, max_width: int) -> str:
+    """Longest prefix of *text* (at least one char) that fits with "…".
+
+    Binary search over the prefix length — O(log n) ``font.size`` calls
+    instead of one per dropped character.
+    """
+    lo, hi = 1, max(1, len(text) - 1)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.size(text[:mid] + "…")[0] <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "…"
 
 
 class Renderer:
@@ -52,6 +78,12 @@ class Renderer:
         # Load fonts
         self.fonts: dict[str, pygame.font.Font] = {}
         self._load_fonts()
+        # (text, font, color) -> rendered surface, most recent last
+        self._text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        # Pre-rendered static bar backgrounds, keyed by what varies them
+        self._bars: dict[tuple, pygame.Surface] = {}
+        # Composited buttons (rounded rect + label), keyed by what varies them
+        self._buttons: dict[tuple, pygame.Surface] = {}
 
         # Parse theme colors
         self.colors = {}
@@ -59,6 +91,18 @@ class Renderer:
         for attr in theme.__dataclass_fields__:
             self.colors[attr] = theme.color(attr)
 
+        # Pre-resolved colors for hot paths (no dict lookup + fallback)
+        self.bg = self.colors["background"]
+        self.surface_clr = self.colors["surface"]
+        self.primary = self.colors["primary"]
+        self.accent = self.colors["accent"]
+        self.text = self.colors["text"]
+        self.text_dim = self.colors["text_dim"]
+        self.success = self.colors["success"]
+        self.warning = self.colors["warning"]
+        self.error = self.colors["error"]
+        self.info = self.colors["info"]
+
     def _load_fonts(self):
         font_path = FONT_DIR / "DejaVuSans.ttf"
         if font_path.exists():
@@ -84,14 +128,38 @@ class Renderer:
         f = self.fonts.get(font, self.fonts["body"])
         c = self.colors.get(color, self.colors["text"])
 
-        if max_width and f.size(text)[0] > max_width:
-            while f.size(text + "…")[0] > max_width and len(text) > 1:
-                text = text[:-1]
-            text += "…"
-
-        surface = f.render(text, True, c)
-        rect = self.screen.blit(surface, (x, y))
-        return rect
+        if max_width and _measure(f, text)[0] > max_width:
+            text = _truncate(f, text, max_width)
+
+        return self.draw_text_fast(text, x, y, c, f)
+
+    def draw_text_fast(self, text: str, x: int, y: int,
+                       color: tuple[int, int, int],
+                       font: pygame.font.Font) -> pygame.Rect:
+        """Draw text with an already-resolved color and font — no lookups,
+        no truncation. For callers that resolve both up front."""
+        return self.screen.blit(self.render_text(text, font, color), (x, y))
+
+    def text_size(self, text: str, font: pygame.font.Font) -> tuple[int, int]:
+        """Rendered (width, height) of *text* in *font* (cached)."""
+        return _measure(font, text)
+
+    def render_text(self, text: str, font: pygame.font.Font,
+                    color: tuple[int, int, int]) -> pygame.Surface:
+        """Rendered text surface, cached so unchanged labels are just a blit.
+
+        The surface is shared — blit it, don't draw on it.
+        """
+        key = (text, font, color)
+        cache = self._text_cache
+        surf = cache.get(key)
+        if surf is None:
+            surf = cache[key] = font.render(text, True, color)
+            if len(cache) > TEXT_CACHE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surf
 
     def draw_rect(self, x: int, y: int, w: int, h: int, color: str = "surface",
                   border_radius: int = 8):
@@ -102,39 +170,70 @@ class Renderer:
 
     def draw_status_bar(self, time_str: str, cpu_temp: str, status_color: str = "success"):
         """Draw the 32px top status bar."""
-        self.draw_rect(0, 0, self.width, 32, "surface", border_radius=0)
-        self.draw_text(time_str, 8, 6, "small", "text_dim")
-        self.draw_text(cpu_temp, self.width - 80, 6, "small", "text_dim")
-        # Status dot
-        dot_color = self.colors.get(status_color, self.colors["success"])
-        pygame.draw.circle(self.screen, dot_color, (self.width - 16, 16), 6)
+        key = ("status", status_color)
+        bar = self._bars.get(key)
+        if bar is None:
+            # Background + status dot never change for a given status color
+            bar = pygame.Surface((self.width, 32))
+            bar.fill(self.surface_clr)
+            pygame.draw.circle(bar, self.colors.get(status_color, self.success),
+                               (self.width - 16, 16), 6)
+            self._bars[key] = bar
+        f = self.fonts["small"]
+        self.screen.blits([
+            (bar, (0, 0)),
+            (self.render_text(time_str, f, self.text_dim), (8, 6)),
+            (self.render_text(cpu_temp, f, self.text_dim), (self.width - 80, 6)),
+        ], doreturn=False)
 
     def draw_nav_bar(self, current_idx: int, total: int):
         """Draw bottom navigation bar with screen indicator dots."""
         y = self.height - 40
-        self.draw_rect(0, y, self.width, 40, "surface", border_radius=0)
-
-        # Dots
         dot_spacing = 16
         start_x = (self.width - (total - 1) * dot_spacing) // 2
-        for i in range(total):
-            x = start_x + i * dot_spacing
-            color = self.colors["accent"] if i == current_idx else self.colors["text_dim"]
-            pygame.draw.circle(self.screen, color, (x, y + 12), 4)
+
+        key = ("nav", total)
+        bar = self._bars.get(key)
+        if bar is None:
+            # Background + the row of inactive dots
+            bar = pygame.Surface((self.width, 40))
+            bar.fill(self.surface_clr)
+            for i in range(total):
+                pygame.draw.circle(bar, self.text_dim,
+                                   (start_x + i * dot_spacing, 12), 4)
+            self._bars[key] = bar
+        self.screen.blit(bar, (0, y))
+
+        # Active dot on top
+        if 0 <= current_idx < total:
+            pygame.draw.circle(self.screen, self.accent,
+                               (start_x + current_idx * dot_spacing, y + 12), 4)
 
     def draw_button(self, text: str, x: int, y: int, w: int, h: int,
                     color: str = "primary", text_color: str = "text") -> pygame.Rect:
         """Draw a tappable button and return its rect for hit testing."""
-        rect = self.draw_rect(x, y, w, h, color, border_radius=12)
-        f = self.fonts["body"]
-        tw, th = f.size(text)
-        tx = x + (w - tw) // 2
-        ty = y + (h - th) // 2
-        self.draw_text(text, tx, ty, "body", text_color)
-        return rect
-
-    def flip(self):
-        pygame.display.flip()
+        key = (text, w, h, color, text_color)
+        btn = self._buttons.get(key)
+        if btn is None:
+            # Labels come from a small fixed set — composite each once
+            btn = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(btn, self.colors.get(color, self.surface_clr),
+                             btn.get_rect(), border_radius=12)
+            f = self.fonts["body"]
+            tw, th = _measure(f, text)
+            btn.blit(self.render_text(
+                text, f, self.colors.get(text_color, self.text)),
+                ((w - tw) // 2, (h - th) // 2))
+            self._buttons[key] = btn
+        self.screen.blit(btn, (x, y))
+        return btn.get_rect(topleft=(x, y))
+
+    def flip(self, dirty: list[pygame.Rect] | None = None):
+        """Present the frame — only the *dirty* rects when given."""
+        if dirty:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
 
     def quit(self):
         pygame.quit()
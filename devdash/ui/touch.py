@@ -16,6 +16,39 @@ log = logging.getLogger(__name__)
 SWIPE_THRESHOLD = 50  # pixels
 LONG_PRESS_MS = 600
 TAP_MAX_MS = 300
+# Integer nanosecond forms for the monotonic_ns() timing below
+LONG_PRESS_NS = LONG_PRESS_MS * 1_000_000
+TAP_MAX_NS = TAP_MAX_MS * 1_000_000
+
+# Posted by SDL's timer once a press has been held for LONG_PRESS_MS
+LONG_PRESS_EVENT = pygame.event.custom_type()
+
+# The only event types gestures are built from; fetched with one typed get()
+_GESTURE_EVENTS = (
+    pygame.QUIT, pygame.KEYDOWN, LONG_PRESS_EVENT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.FINGERDOWN, pygame.FINGERUP,
+)
+# Pointer motion — only queued when drag tracking is enabled
+_MOTION_EVENTS = (pygame.MOUSEMOTION, pygame.FINGERMOTION)
+
+
+def input_event_types(track_motion: bool = False) -> tuple[int, ...]:
+    """Event types TouchHandler reads (plus pointer motion if tracked)."""
+    return _GESTURE_EVENTS + (_MOTION_EVENTS if track_motion else ())
+
+
+def configure_event_queue(track_motion: bool = False) -> None:
+    """App-level setup: let SDL queue only the events TouchHandler reads.
+
+    This sets SDL's process-wide event filter, so call it once at start-up
+    after the display is initialised, not per handler. Every other type is
+    dropped before it is queued, so nothing piles up unread. A component
+    that needs more types must ``pygame.event.set_allowed()`` them after
+    this call.
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(input_event_types(track_motion))
 
 
 class GestureType(Enum):
@@ -27,7 +60,14 @@ class GestureType(Enum):
     LONG_PRESS = auto()
 
 
-@dataclass
+# Indexed by (vertical << 1) | (delta > 0)
+_SWIPE_LUT = (
+    GestureType.SWIPE_LEFT, GestureType.SWIPE_RIGHT,
+    GestureType.SWIPE_UP, GestureType.SWIPE_DOWN,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Gesture:
     type: GestureType
     x: int
@@ -36,45 +76,103 @@ class Gesture:
     start_y: int
 
 
+# Keyboard fallback for desktop testing — frozen, so built once and shared
+_KEY_GESTURES = {
+    pygame.K_LEFT: Gesture(GestureType.SWIPE_LEFT, 240, 160, 340, 160),
+    pygame.K_RIGHT: Gesture(GestureType.SWIPE_RIGHT, 240, 160, 140, 160),
+    pygame.K_UP: Gesture(GestureType.SWIPE_UP, 240, 160, 240, 260),
+    pygame.K_DOWN: Gesture(GestureType.SWIPE_DOWN, 240, 160, 240, 60),
+    pygame.K_RETURN: Gesture(GestureType.TAP, 240, 160, 240, 160),
+}
+
+
 class TouchHandler:
-    def __init__(self, config: AppConfig):
+    """Turn queued pointer and key events into gestures.
+
+    Reads only input_event_types(track_motion); the app calls
+    configure_event_queue() with the same flag once at start-up.
+    """
+
+    def __init__(self, config: AppConfig, track_motion: bool = False):
         self.config = config
+        # Finger events carry normalized coordinates
+        self._w = config.display.width
+        self._h = config.display.height
         self._touch_start: tuple[int, int] | None = None
-        self._touch_start_time: float = 0
-
-    def process_events(self) -> list[Gesture]:
-        """Process PyGame events and return detected gestures."""
+        self._touch_start_ns: int = 0
+        self._touch_id: int = -1
+        # Polling calls closer together than this don't touch the queue
+        display = config.display
+        self._min_interval_ns = int((display.frame_period / 2
+                                     if display.event_interval is None
+                                     else display.event_interval) * 1e9)
+        self._last_pump_ns: int = 0
+        # Newest position per pointer (finger id, -1 for the mouse); motion
+        # is coalesced into this instead of being handled event by event
+        self._last_motion: dict[int, tuple[int, int]] = {}
+        # Only these types are read; configure_event_queue() keeps the rest
+        # out of the queue
+        self._events = input_event_types(track_motion)
+
+    def process_events(self, wait_ms: int | None = None) -> list[Gesture]:
+        """Process PyGame events and return detected gestures.
+
+        With *wait_ms*, block for up to that long until an event arrives
+        instead of polling. Long presses arrive as a timer event, so a held
+        press wakes the wait on time. Not for use inside the asyncio loop.
+        """
         gestures = []
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        now = time.monotonic_ns()
+        first = None
+        if wait_ms:
+            first = pygame.event.wait(wait_ms)
+        elif now - self._last_pump_ns < self._min_interval_ns:
+            # Drained moments ago — nothing new to report yet
+            return gestures
+        self._last_pump_ns = now
+        events = pygame.event.get(self._events)
+        if first is not None and first.type in self._events:
+            events.insert(0, first)
+        for event in events:
+            if event.type in _MOTION_EVENTS:
+                # Keep only the latest sample per pointer
+                self._last_motion[self._pointer_id(event)] = self._pos(event)
+
+            elif event.type == pygame.QUIT:
                 raise SystemExit
 
             elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN):
-                if event.type == pygame.FINGERDOWN:
-                    x = int(event.x * self.config.display.width)
-                    y = int(event.y * self.config.display.height)
-                else:
-                    x, y = event.pos
+                x, y = self._pos(event)
                 self._touch_start = (x, y)
-                self._touch_start_time = time.monotonic()
+                self._touch_start_ns = time.monotonic_ns()
+                self._touch_id = self._pointer_id(event)
+                self._last_motion.pop(self._touch_id, None)
+                pygame.time.set_timer(LONG_PRESS_EVENT, LONG_PRESS_MS, loops=1)
 
-            elif event.type in (pygame.MOUSEBUTTONUP, pygame.FINGERUP):
+            elif event.type == LONG_PRESS_EVENT:
                 if self._touch_start is None:
                     continue
+                sx, sy = self._touch_start
+                # A press that has been dragged away is not a long press
+                x, y = self._last_motion.get(self._touch_id, (sx, sy))
+                if (abs(x - sx) <= SWIPE_THRESHOLD
+                        and abs(y - sy) <= SWIPE_THRESHOLD):
+                    gestures.append(Gesture(GestureType.LONG_PRESS, sx, sy, sx, sy))
+                    self._touch_start = None
 
-                if event.type == pygame.FINGERUP:
-                    x = int(event.x * self.config.display.width)
-                    y = int(event.y * self.config.display.height)
-                else:
-                    x, y = event.pos
+            elif event.type in (pygame.MOUSEBUTTONUP, pygame.FINGERUP):
+                if self._touch_start is None:
+                    continue
 
+                pygame.time.set_timer(LONG_PRESS_EVENT, 0)
+                x, y = self._pos(event)
                 sx, sy = self._touch_start
                 dx = x - sx
                 dy = y - sy
-                duration = time.monotonic() - self._touch_start_time
+                duration_ns = time.monotonic_ns() - self._touch_start_ns
 
-                gesture = self._classify(sx, sy, x, y, dx, dy, duration)
+                gesture = self._classify(sx, sy, x, y, dx, dy, duration_ns)
                 if gesture:
                     gestures.append(gesture)
 
@@ -82,43 +180,41 @@ class TouchHandler:
 
             # Keyboard fallback for desktop testing
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    gestures.append(Gesture(GestureType.SWIPE_LEFT, 240, 160, 340, 160))
-                elif event.key == pygame.K_RIGHT:
-                    gestures.append(Gesture(GestureType.SWIPE_RIGHT, 240, 160, 140, 160))
-                elif event.key == pygame.K_UP:
-                    gestures.append(Gesture(GestureType.SWIPE_UP, 240, 160, 240, 260))
-                elif event.key == pygame.K_DOWN:
-                    gestures.append(Gesture(GestureType.SWIPE_DOWN, 240, 160, 240, 60))
-                elif event.key == pygame.K_RETURN:
-                    gestures.append(Gesture(GestureType.TAP, 240, 160, 240, 160))
+                gesture = _KEY_GESTURES.get(event.key)
+                if gesture is not None:
+                    gestures.append(gesture)
                 elif event.key == pygame.K_q:
                     raise SystemExit
 
-        # Check for long press while still holding
-        if self._touch_start is not None:
-            elapsed = time.monotonic() - self._touch_start_time
-            if elapsed > LONG_PRESS_MS / 1000:
-                sx, sy = self._touch_start
-                gestures.append(Gesture(GestureType.LONG_PRESS, sx, sy, sx, sy))
-                self._touch_start = None
-
         return gestures
 
+    def _pos(self, event: pygame.event.Event) -> tuple[int, int]:
+        """Screen position of a mouse or (normalized) finger event."""
+        if event.type in (pygame.FINGERDOWN, pygame.FINGERUP,
+                          pygame.FINGERMOTION):
+            return int(event.x * self._w), int(event.y * self._h)
+        return event.pos
+
+    @staticmethod
+    def _pointer_id(event: pygame.event.Event) -> int:
+        return getattr(event, "finger_id", -1)
+
     def _classify(self, sx: int, sy: int, x: int, y: int,
-                  dx: int, dy: int, duration: float) -> Gesture | None:
+                  dx: int, dy: int, duration_ns: int) -> Gesture | None:
+        # A quick touch that never moved is the common case
+        if not dx and not dy and duration_ns < TAP_MAX_NS:
+            return Gesture(GestureType.TAP, x, y, sx, sy)
+
         abs_dx, abs_dy = abs(dx), abs(dy)
 
         # Swipe detection
         if abs_dx > SWIPE_THRESHOLD or abs_dy > SWIPE_THRESHOLD:
-            if abs_dx > abs_dy:
-                gt = GestureType.SWIPE_RIGHT if dx > 0 else GestureType.SWIPE_LEFT
-            else:
-                gt = GestureType.SWIPE_DOWN if dy > 0 else GestureType.SWIPE_UP
-            return Gesture(gt, x, y, sx, sy)
+            vertical = abs_dy >= abs_dx
+            delta = dy if vertical else dx
+            return Gesture(_SWIPE_LUT[vertical << 1 | (delta > 0)], x, y, sx, sy)
 
         # Long press
-        if duration > LONG_PRESS_MS / 1000:
+        if duration_ns > LONG_PRESS_NS:
             return Gesture(GestureType.LONG_PRESS, x, y, sx, sy)
 
         # Tap
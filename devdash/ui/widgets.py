@@ -15,12 +15,14 @@ class ChatBubble:
     def draw(renderer: Renderer, lines: list[str], x: int, y: int,
              w: int, color: str = "surface") -> pygame.Rect:
         h = len(lines) * 20 + 2 * T.BUBBLE_PADDING
-        renderer.draw_rect(x, y, w, h, color, T.BUBBLE_BORDER_RADIUS)
-        ty = y + T.BUBBLE_PADDING
+        rect = renderer.draw_rect(x, y, w, h, color, T.BUBBLE_BORDER_RADIUS)
+        draw = renderer.draw_text_fast
+        font, text_clr = renderer.fonts["body"], renderer.text
+        tx, ty = x + T.BUBBLE_PADDING, y + T.BUBBLE_PADDING
         for line in lines:
-            renderer.draw_text(line, x + T.BUBBLE_PADDING, ty, "body", "text")
+            draw(line, tx, ty, text_clr, font)
             ty += 20
-        return pygame.Rect(x, y, w, h)
+        return rect
 
 
 class MicButton:
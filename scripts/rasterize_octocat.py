@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Pre-render the Octocat SVG to PNGs at the heights DevDash draws Mona.
+
+MonaAvatar loads ``devdash/assets/octocat_<height>.png`` when it exists,
+so with these in place the Pi skips cairosvg (and its first-draw cost)
+at runtime.
+
+Usage: python scripts/rasterize_octocat.py [--config config.yaml] [HEIGHT ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from devdash.config import load_config
+from devdash.screens.conversation import MINI_MONA_H, splash_mona_h
+from devdash.ui import mona
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("heights", nargs="*", type=int,
+                        help="heights in px (default: splash + bottom-bar sizes)")
+    parser.add_argument("--config", type=Path, default=None,
+                        help="config.yaml to read the display height from")
+    args = parser.parse_args()
+
+    if not mona._HAS_CAIRO:
+        print("cairosvg is not installed — nothing rasterized", file=sys.stderr)
+        return 1
+
+    heights = args.heights or [
+        splash_mona_h(load_config(args.config).display.height),
+        MINI_MONA_H,
+    ]
+    svg = mona._SVG_PATH.read_bytes()
+    for h in heights:
+        out = mona.png_path(h)
+        out.write_bytes(mona.svg_to_png(svg, h))
+        print(f"  {out.name} ({h}px)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -54,6 +54,12 @@ if [ ! -f "$FONT_DIR/DejaVuSans.ttf" ]; then
     echo "   → DejaVu fonts not found — will use PyGame default font"
 fi
 
+# Pre-rendered avatar PNGs (skip cairosvg rasterization at runtime)
+echo ""
+echo "🐙 Rasterizing Octocat avatar..."
+python scripts/rasterize_octocat.py || \
+    echo "   → cairosvg unavailable — Mona will rasterize at runtime"
+
 echo ""
 echo "✅ Setup complete!"
 echo ""